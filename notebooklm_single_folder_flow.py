@@ -1,24 +1,42 @@
 # notebooklm_single_folder_flow.py
 # -*- coding: utf-8 -*-
+import io
+import importlib.util
 import os
 import re
+import ctypes
 import sys
 import time
+import shutil
+import subprocess
+import queue
 import logging
+import threading
+from logging.handlers import QueueHandler, QueueListener
 import webbrowser
+import zipfile
+from xml.sax.saxutils import escape as xml_escape
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Set, Tuple
 
 import customtkinter as ctk
 from tkinter import messagebox, TclError
 
 from watchdog.observers import Observer
+from watchdog.observers.polling import PollingObserver
 from watchdog.events import FileSystemEventHandler
 
 # ==================== 基本設定 ====================
 
 APP_VERSION = "1.2.0"
 
+# Windows 剪貼簿通知
+_WM_DESTROY = 0x0002
+_WM_CLOSE = 0x0010
+_WM_CLIPBOARDUPDATE = 0x031D
+_HWND_MESSAGE = -3
+
 def get_base_path() -> str:
     """取得程式基底路徑（支援 PyInstaller）"""
     if getattr(sys, "frozen", False):
@@ -36,9 +54,15 @@ class AppConfig:
     input_folder: str = "input"
     output_folder: str = "output"
 
+    # 網路磁碟（SMB/NFS）改用輪詢監控時的掃描間隔（秒）
+    watch_interval: float = 30.0
+
     tags = ["【標準】", "【範本】", "【待審】"]
+    # 供 str.startswith 一次比對所有標籤
+    tag_tuple: Tuple[str, ...] = field(init=False, default=())
 
     def __post_init__(self):
+        self.tag_tuple = tuple(self.tags)
         if self.projects is None:
             self.projects = ["【雲端案】", "【整合案】", "【Trod案】"]
         if self.deliveries is None:
@@ -46,8 +70,11 @@ class AppConfig:
 
 # ==================== 工具 ====================
 
+_SANITIZE_RE = re.compile(r'[\\/:*?"<>|]+')
+_SKIP_PREFIXES = ("~$", ".")
+
 def sanitize_filename(name: str) -> str:
-    return re.sub(r'[\\/:*?"<>|]+', "_", name)
+    return _SANITIZE_RE.sub("_", name)
 
 def shorten_path(path: str, max_len: int = 60) -> str:
     if len(path) <= max_len:
@@ -56,17 +83,259 @@ def shorten_path(path: str, max_len: int = 60) -> str:
     tail = max_len - head - 3
     return f"{path[:head]}...{path[-tail:]}"
 
+# (秒, 格式化字串)；整組替換，背景執行緒讀取時不會拿到不一致的值
+_last_ts = (0, "")
+
 def now_ts() -> str:
-    return time.strftime("%Y%m%d_%H%M%S")
+    global _last_ts
+    t = int(time.time())
+    if t != _last_ts[0]:
+        _last_ts = (t, time.strftime("%Y%m%d_%H%M%S", time.localtime(t)))
+    return _last_ts[1]
 
 def is_skip_file(fn: str) -> bool:
-    return fn.startswith("~$") or fn.startswith(".") or fn.endswith(".tmp")
+    return fn.startswith(_SKIP_PREFIXES) or fn.endswith(".tmp")
+
+_REMOTE_FS_TYPES = frozenset({"cifs", "smb3", "smbfs", "nfs", "nfs4", "afpfs", "9p", "fuse.sshfs"})
+
+# macOS `mount` 輸出：//user@server/share on /Volumes/share (smbfs, nodev, ...)
+_MAC_MOUNT_RE = re.compile(r"^.+? on (.+) \(([^,)]+)")
+
+def _list_mounts() -> List[Tuple[str, str]]:
+    """目前掛載點清單 [(掛載路徑, 檔案系統類型)]：Linux 讀 /proc/mounts，macOS 解析 mount 指令"""
+    mounts = []
+    if sys.platform == 'darwin':
+        result = subprocess.run(["mount"], capture_output=True, text=True, timeout=2)
+        for line in result.stdout.splitlines():
+            m = _MAC_MOUNT_RE.match(line)
+            if m:
+                mounts.append((m.group(1), m.group(2).strip()))
+        return mounts
+    with open("/proc/mounts", encoding="utf-8") as f:
+        for line in f:
+            parts = line.split()
+            if len(parts) >= 3:
+                mounts.append((parts[1].replace("\\040", " "), parts[2]))
+    return mounts
+
+def is_remote_path(path: str) -> bool:
+    """判斷路徑是否位於網路磁碟（原生監控在 SMB/NFS 上可能漏掉事件）"""
+    try:
+        path = os.path.abspath(path)
+        if os.name == 'nt':
+            drive = os.path.splitdrive(path)[0]
+            if drive.startswith("\\\\"):
+                return True
+            if not drive:
+                return False
+            # DRIVE_REMOTE = 4
+            return ctypes.windll.kernel32.GetDriveTypeW(drive + "\\") == 4
+
+        real = os.path.realpath(path)
+        best_mnt, best_type = "", ""
+        for mnt, fstype in _list_mounts():
+            prefix = mnt.rstrip("/") + "/"
+            if (real == mnt or real.startswith(prefix)) and len(mnt) > len(best_mnt):
+                best_mnt, best_type = mnt, fstype
+        return best_type in _REMOTE_FS_TYPES
+    except Exception:
+        return False
+
+# 開啟資料夾的系統指令（Windows 用 os.startfile）
+if os.name == 'nt':
+    _OPEN_CMD = None
+elif sys.platform == 'darwin':
+    _OPEN_CMD = "open"
+else:
+    _OPEN_CMD = "xdg-open"
+
+def _find_clipboard_reader() -> Optional[List[str]]:
+    """非 Windows 平台可在背景執行緒讀取剪貼簿的外部指令（Tk 的 clipboard_get 只能在主執行緒執行）"""
+    if os.name == 'nt':
+        return None
+    if sys.platform == 'darwin':
+        candidates = [["pbpaste"]]
+    else:
+        candidates = [
+            ["xclip", "-selection", "clipboard", "-o"],
+            ["xsel", "--clipboard", "--output"],
+        ]
+        if os.environ.get("WAYLAND_DISPLAY"):
+            candidates.insert(0, ["wl-paste", "--no-newline"])
+    for cmd in candidates:
+        if shutil.which(cmd[0]):
+            return cmd
+    return None
+
+_CLIP_READ_CMD = _find_clipboard_reader()
+# pbpaste 依 locale 決定輸出編碼；從 Finder 啟動時常沒有 LANG，固定為 UTF-8
+_CLIP_READ_ENV = (
+    {**os.environ, "LC_ALL": "en_US.UTF-8"} if sys.platform == 'darwin' else None
+)
+
+def read_clipboard_external() -> Optional[str]:
+    """以外部指令讀取剪貼簿；無法讀取時回傳 None（由呼叫端改用 Tk）"""
+    if not _CLIP_READ_CMD:
+        return None
+    try:
+        result = subprocess.run(
+            _CLIP_READ_CMD, capture_output=True, timeout=2, env=_CLIP_READ_ENV
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    if result.returncode != 0:
+        # 剪貼簿沒有文字內容時，這些指令會以非 0 結束
+        return ""
+    return result.stdout.decode("utf-8", errors="replace")
+
+class ClipboardListener:
+    """Windows 剪貼簿通知：背景執行緒建立 message-only 視窗並執行自己的訊息迴圈。
+
+    視窗程序在該執行緒執行，不呼叫 Tk；有變動時呼叫 on_change，由呼叫端交回主執行緒。
+    """
+
+    def __init__(self, on_change, logger: logging.Logger):
+        self._on_change = on_change
+        self.logger = logger
+        self._thread = None
+        self._hwnd = None
+        self._stop_requested = False
+        self._lock = threading.Lock()
+        self._ready = threading.Event()
+
+    def start(self) -> bool:
+        """啟動監聽，成功回傳 True；非 Windows 或註冊失敗回傳 False（呼叫端改用輪詢）"""
+        if os.name != 'nt':
+            return False
+        if self._thread is not None:
+            return self._hwnd is not None
+        self._stop_requested = False
+        self._ready.clear()
+        self._thread = threading.Thread(target=self._run, name="ClipboardListener", daemon=True)
+        self._thread.start()
+        self._ready.wait(2.0)
+        if self._hwnd is None:
+            self.stop()
+            return False
+        return True
+
+    def stop(self):
+        thread, self._thread = self._thread, None
+        if thread is None:
+            return
+        with self._lock:
+            self._stop_requested = True
+            hwnd = self._hwnd
+        if hwnd:
+            # 跨執行緒只用 PostMessage；WM_CLOSE -> DestroyWindow -> WM_DESTROY 結束迴圈
+            ctypes.windll.user32.PostMessageW(hwnd, _WM_CLOSE, 0, 0)
+        thread.join(1.0)
+
+    def _run(self):
+        from ctypes import wintypes
+
+        user32 = ctypes.WinDLL("user32", use_last_error=True)
+        kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+        LRESULT = ctypes.c_ssize_t
+        WNDPROC = ctypes.WINFUNCTYPE(
+            LRESULT, wintypes.HWND, wintypes.UINT, wintypes.WPARAM, wintypes.LPARAM
+        )
+
+        class WNDCLASSW(ctypes.Structure):
+            _fields_ = [
+                ("style", wintypes.UINT),
+                ("lpfnWndProc", WNDPROC),
+                ("cbClsExtra", ctypes.c_int),
+                ("cbWndExtra", ctypes.c_int),
+                ("hInstance", wintypes.HINSTANCE),
+                ("hIcon", wintypes.HICON),
+                ("hCursor", wintypes.HICON),
+                ("hbrBackground", wintypes.HBRUSH),
+                ("lpszMenuName", wintypes.LPCWSTR),
+                ("lpszClassName", wintypes.LPCWSTR),
+            ]
+
+        user32.DefWindowProcW.restype = LRESULT
+        user32.DefWindowProcW.argtypes = [wintypes.HWND, wintypes.UINT, wintypes.WPARAM, wintypes.LPARAM]
+        user32.RegisterClassW.restype = wintypes.ATOM
+        user32.RegisterClassW.argtypes = [ctypes.POINTER(WNDCLASSW)]
+        user32.UnregisterClassW.argtypes = [wintypes.LPCWSTR, wintypes.HINSTANCE]
+        user32.CreateWindowExW.restype = wintypes.HWND
+        user32.CreateWindowExW.argtypes = [
+            wintypes.DWORD, wintypes.LPCWSTR, wintypes.LPCWSTR, wintypes.DWORD,
+            ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.c_int,
+            wintypes.HWND, wintypes.HMENU, wintypes.HINSTANCE, wintypes.LPVOID,
+        ]
+        user32.DestroyWindow.argtypes = [wintypes.HWND]
+        user32.IsWindow.argtypes = [wintypes.HWND]
+        user32.AddClipboardFormatListener.argtypes = [wintypes.HWND]
+        user32.RemoveClipboardFormatListener.argtypes = [wintypes.HWND]
+        user32.GetMessageW.argtypes = [ctypes.POINTER(wintypes.MSG), wintypes.HWND, wintypes.UINT, wintypes.UINT]
+        user32.TranslateMessage.argtypes = [ctypes.POINTER(wintypes.MSG)]
+        user32.DispatchMessageW.argtypes = [ctypes.POINTER(wintypes.MSG)]
+        kernel32.GetModuleHandleW.restype = wintypes.HMODULE
+        kernel32.GetModuleHandleW.argtypes = [wintypes.LPCWSTR]
+
+        def wndproc(hwnd, msg, wparam, lparam):
+            if msg == _WM_CLIPBOARDUPDATE:
+                try:
+                    self._on_change()
+                except Exception:
+                    pass
+                return 0
+            if msg == _WM_DESTROY:
+                user32.RemoveClipboardFormatListener(hwnd)
+                user32.PostQuitMessage(0)
+                return 0
+            return user32.DefWindowProcW(hwnd, msg, wparam, lparam)
+
+        # 視窗類別名稱依執行緒區分，重新啟動時不會和尚未註銷的舊類別衝突
+        class_name = f"LMReviewClipboard_{threading.get_ident()}"
+        proc = WNDPROC(wndproc)  # 必須保留參考直到迴圈結束
+        hinst = kernel32.GetModuleHandleW(None)
+        wc = WNDCLASSW(lpfnWndProc=proc, hInstance=hinst, lpszClassName=class_name)
+        registered = False
+        hwnd = None
+        try:
+            if not user32.RegisterClassW(ctypes.byref(wc)):
+                raise ctypes.WinError(ctypes.get_last_error())
+            registered = True
+            hwnd = user32.CreateWindowExW(
+                0, class_name, None, 0, 0, 0, 0, 0, _HWND_MESSAGE, None, hinst, None
+            )
+            if not hwnd:
+                raise ctypes.WinError(ctypes.get_last_error())
+            if not user32.AddClipboardFormatListener(hwnd):
+                raise ctypes.WinError(ctypes.get_last_error())
+            with self._lock:
+                if self._stop_requested:
+                    return
+                self._hwnd = hwnd
+            self._ready.set()
+
+            msg = wintypes.MSG()
+            while user32.GetMessageW(ctypes.byref(msg), None, 0, 0) > 0:
+                user32.TranslateMessage(ctypes.byref(msg))
+                user32.DispatchMessageW(ctypes.byref(msg))
+        except Exception as e:
+            self.logger.warning("無法註冊剪貼簿通知，改用輪詢：%s", e)
+        finally:
+            with self._lock:
+                self._hwnd = None
+            if hwnd and user32.IsWindow(hwnd):
+                user32.DestroyWindow(hwnd)
+            if registered:
+                user32.UnregisterClassW(class_name, hinst)
+            self._ready.set()
 
 def open_folder(path: str):
     os.makedirs(path, exist_ok=True)
-    if os.name == 'nt':
+    if _OPEN_CMD is None:
         os.startfile(path)
-    else:
+        return
+    try:
+        subprocess.Popen([_OPEN_CMD, path])
+    except OSError:
         webbrowser.open(f'file://{path}')
 
 # ==================== 檔案管理 ====================
@@ -75,37 +344,67 @@ class FileManager:
     def __init__(self, cfg: AppConfig, logger: logging.Logger):
         self.cfg = cfg
         self.logger = logger
+        self._build_dirs()
+
+    def _build_dirs(self):
+        """預先組好 (專案, 交付) -> (input, output) 路徑；base_path 變更時需重建"""
+        self._dirs = {
+            (p, d): self._join_dirs(p, d)
+            for p in self.cfg.projects
+            for d in self.cfg.deliveries
+        }
+
+    def _join_dirs(self, project: str, delivery: str) -> Tuple[str, str]:
+        root = self.project_root(project, delivery)
+        return (
+            os.path.join(root, self.cfg.input_folder),
+            os.path.join(root, self.cfg.output_folder),
+        )
+
+    def _dirs_for(self, project: str, delivery: str) -> Tuple[str, str]:
+        key = (project, delivery)
+        dirs = self._dirs.get(key)
+        if dirs is None:
+            dirs = self._dirs[key] = self._join_dirs(project, delivery)
+        return dirs
 
     def project_root(self, project: str, delivery: str) -> str:
         return os.path.join(self.cfg.base_path, project, delivery)
 
     def input_dir(self, project: str, delivery: str) -> str:
-        return os.path.join(self.project_root(project, delivery), self.cfg.input_folder)
+        return self._dirs_for(project, delivery)[0]
 
     def output_dir(self, project: str, delivery: str) -> str:
-        return os.path.join(self.project_root(project, delivery), self.cfg.output_folder)
+        return self._dirs_for(project, delivery)[1]
 
     def ensure_structure(self):
-        for p in self.cfg.projects:
-            for d in self.cfg.deliveries:
-                os.makedirs(self.input_dir(p, d), exist_ok=True)
-                os.makedirs(self.output_dir(p, d), exist_ok=True)
+        # 已存在的資料夾直接略過，常見情況下不需任何 mkdir
+        for dirs in self._dirs.values():
+            for folder in dirs:
+                if not os.path.isdir(folder):
+                    os.makedirs(folder, exist_ok=True)
 
     def list_input_files(self, project: str, delivery: str) -> Tuple[List[str], List[str]]:
         """返回 (已標記檔案列表, 未標記檔案列表)"""
         folder = self.input_dir(project, delivery)
-        if not os.path.exists(folder):
+        tagged, untagged = [], []
+        try:
+            # scandir 直接帶回檔案類型，免去逐檔 stat
+            with os.scandir(folder) as it:
+                for e in it:
+                    name = e.name
+                    if is_skip_file(name) or not e.is_file():
+                        continue
+                    if name.startswith(self.cfg.tag_tuple):
+                        tagged.append(name)
+                    else:
+                        untagged.append(name)
+        except (FileNotFoundError, NotADirectoryError):
             return [], []
-        
-        all_files = [
-            f for f in os.listdir(folder)
-            if os.path.isfile(os.path.join(folder, f)) and not is_skip_file(f)
-        ]
-        
-        tagged = [f for f in all_files if any(f.startswith(t) for t in self.cfg.tags)]
-        untagged = [f for f in all_files if not any(f.startswith(t) for t in self.cfg.tags)]
-        
-        return sorted(tagged), sorted(untagged)
+
+        tagged.sort()
+        untagged.sort()
+        return tagged, untagged
 
     def tag_file(self, project: str, delivery: str, filename: str, tag: str) -> Tuple[bool, str]:
         """為檔案加上標籤"""
@@ -121,18 +420,16 @@ class FileManager:
             if os.path.exists(new_path):
                 return False, "目標檔名已存在"
             
-            # 等待檔案穩定
-            for _ in range(5):
+            # 先直接改名；檔案仍被佔用（例如還在寫入）時以遞增間隔重試
+            for delay in (0.02, 0.04, 0.08, 0.16, 0.32):
                 try:
-                    size1 = os.path.getsize(old_path)
-                    time.sleep(0.1)
-                    size2 = os.path.getsize(old_path)
-                    if size1 == size2:
-                        break
-                except:
-                    time.sleep(0.1)
-            
-            os.rename(old_path, new_path)
+                    os.rename(old_path, new_path)
+                    break
+                except PermissionError:
+                    time.sleep(delay)
+            else:
+                os.rename(old_path, new_path)
+
             self.logger.info(f"✓ 標記完成：{filename} → {new_filename}")
             return True, new_filename
             
@@ -144,40 +441,120 @@ class FileManager:
 
 # ==================== Word 輸出 ====================
 
+# 直接輸出時沿用 python-docx 內建的 default.docx：樣式、主題、設定等固定部分原樣複製，
+# 只替換 word/document.xml，輸出與 Document() 一致
+_docx_template: Optional[Tuple[List[Tuple[str, bytes]], bytes, bytes]] = None
+
+def _load_docx_template() -> Tuple[List[Tuple[str, bytes]], bytes, bytes]:
+    """讀取 python-docx 預設範本一次：(固定部分, document.xml 開頭, document.xml 結尾)"""
+    global _docx_template
+    if _docx_template is None:
+        # 只找套件位置，不 import docx（避免載入 lxml 與整個物件模型）
+        spec = importlib.util.find_spec("docx")
+        if spec is None or not spec.submodule_search_locations:
+            raise ImportError("找不到 python-docx")
+        template = os.path.join(list(spec.submodule_search_locations)[0], "templates", "default.docx")
+        with zipfile.ZipFile(template) as zf:
+            parts = [(name, zf.read(name)) for name in zf.namelist() if name != "word/document.xml"]
+            document = zf.read("word/document.xml")
+        # 保留原本的命名空間宣告與 sectPr（版面設定），段落插在兩者之間
+        body = document.index(b"<w:body>") + len(b"<w:body>")
+        sect = document.index(b"<w:sectPr", body)
+        _docx_template = (parts, document[:body], document[sect:])
+    return _docx_template
+
+# XML 1.0 不允許的控制字元（寫入前移除，避免產生無法開啟的檔案）
+_XML_INVALID_RE = re.compile("[\x00-\x08\x0b\x0c\x0e-\x1f]")
+
+_BULLETS = frozenset("-•●")
+
+def _docx_paragraph(text: str, style: Optional[str] = None) -> bytes:
+    ppr = f'<w:pPr><w:pStyle w:val="{style}"/></w:pPr>' if style else ""
+    text = xml_escape(_XML_INVALID_RE.sub("", text))
+    return f'<w:p>{ppr}<w:r><w:t xml:space="preserve">{text}</w:t></w:r></w:p>'.encode("utf-8")
+
 class WordExporter:
     def __init__(self, logger: logging.Logger):
         self.logger = logger
 
     def export(self, output_dir: str, source_filename: str, content: str) -> str:
-        try:
-            from docx import Document
-        except ImportError:
-            self.logger.error("缺少 python-docx，執行：pip install python-docx")
-            raise
-
         os.makedirs(output_dir, exist_ok=True)
 
         safe = sanitize_filename(source_filename)
         path = os.path.join(output_dir, f"Review_{safe}_{now_ts()}.docx")
 
-        doc = Document()
-        
-        # 標題
-        heading = doc.add_heading(f"{source_filename} 審查結果", level=1)
-        
-        # 內容
+        try:
+            self._write_docx(path, source_filename, content)
+        except Exception as e:
+            self.logger.warning("直接輸出 docx 失敗，改用 python-docx：%s", e)
+            self._write_python_docx(path, source_filename, content)
+
+        self.logger.info(f"Word 已輸出：{path}")
+        return path
+
+    @staticmethod
+    def _iter_lines(content: str):
+        """逐行產生 (文字, 是否為項目符號)，略過空行"""
         for line in content.splitlines():
             stripped = line.strip()
             if not stripped:
                 continue
-            if stripped.startswith(("-", "•", "●")):
-                doc.add_paragraph(stripped.lstrip("-•● ").strip(), style="List Bullet")
+            if stripped[0] in _BULLETS:
+                yield stripped[1:].lstrip(), True
             else:
-                doc.add_paragraph(stripped)
+                yield stripped, False
+
+    def _write_docx(self, path: str, source_filename: str, content: str):
+        """直接寫入 word/document.xml，不建立 python-docx 物件樹"""
+        parts, head, tail = _load_docx_template()
+        buf = io.BytesIO()
+        write = buf.write
+        write(head)
+        para = _docx_paragraph
+        write(para(f"{source_filename} 審查結果", "Heading1"))
+        for text, bullet in self._iter_lines(content):
+            write(para(text, "ListBullet" if bullet else None))
+        write(tail)
+
+        with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as zf:
+            for name, data in parts:
+                zf.writestr(name, data)
+            zf.writestr("word/document.xml", buf.getvalue())
+
+    def _write_python_docx(self, path: str, source_filename: str, content: str):
+        try:
+            from docx import Document
+            from docx.oxml.ns import qn
+            from lxml import etree
+        except ImportError:
+            self.logger.error("缺少 python-docx，執行：pip install python-docx")
+            raise
+
+        doc = Document()
+
+        # 標題
+        doc.add_heading(f"{source_filename} 審查結果", level=1)
+
+        # 內容：直接組 <w:p> 元素，略過 add_paragraph 的包裝物件與樣式查找
+        body = doc.element.body
+        sect_pr = body.find(qn("w:sectPr"))
+        insert = sect_pr.addprevious if sect_pr is not None else body.append
+        sub = etree.SubElement
+        tag_p, tag_ppr, tag_style = qn("w:p"), qn("w:pPr"), qn("w:pStyle")
+        tag_r, tag_t, attr_val = qn("w:r"), qn("w:t"), qn("w:val")
+        attr_space = "{http://www.w3.org/XML/1998/namespace}space"
+        bullet_style = doc.styles["List Bullet"].style_id
+
+        for text, bullet in self._iter_lines(content):
+            p = etree.Element(tag_p)
+            if bullet:
+                sub(sub(p, tag_ppr), tag_style).set(attr_val, bullet_style)
+            t = sub(sub(p, tag_r), tag_t)
+            t.text = _XML_INVALID_RE.sub("", text)
+            t.set(attr_space, "preserve")
+            insert(p)
 
         doc.save(path)
-        self.logger.info(f"Word 已輸出：{path}")
-        return path
 
 # ==================== Watchdog ====================
 
@@ -185,7 +562,29 @@ class AutoTagHandler(FileSystemEventHandler):
     def __init__(self, app):
         super().__init__()
         self.app = app
-        self.processing = set()
+        self._pending = False
+        self.last_event = 0.0
+        # 新建檔案先累積，800ms 後一次掃描目錄處理
+        self._pending_paths = set()
+        self._drain_scheduled = False
+        self._lock = threading.Lock()
+
+    def _request_refresh(self, delay_ms: int = 250):
+        """合併連續事件：已有刷新排程時只記錄時間，不再重複排程"""
+        self.last_event = time.monotonic()
+        self.app.invalidate_listing()
+        if self._pending:
+            return
+        self._pending = True
+        # 監控執行緒不直接操作 Tk 計時器，交回主執行緒排程
+        try:
+            self.app.after(0, self.app.schedule_refresh, delay_ms)
+        except (RuntimeError, TclError):
+            # mainloop 尚未啟動或視窗已關閉；清除旗標，下一個事件可再排程
+            self._pending = False
+
+    def refresh_done(self):
+        self._pending = False
 
     def on_created(self, event):
         if event.is_directory:
@@ -194,12 +593,22 @@ class AutoTagHandler(FileSystemEventHandler):
         filepath = event.src_path
         filename = os.path.basename(filepath)
         
-        if is_skip_file(filename) or filepath in self.processing:
+        if is_skip_file(filename):
             return
-        
-        self.processing.add(filepath)
+
+        with self._lock:
+            self._pending_paths.add(filepath)
+            if self._drain_scheduled:
+                return
+            self._drain_scheduled = True
         # 延遲處理，確保檔案寫入完成
-        self.app.after(800, lambda: self.handle_file(filepath))
+        try:
+            self.app.after(800, self._drain)
+        except (RuntimeError, TclError):
+            # mainloop 尚未啟動或視窗已關閉；清除狀態，下一個新檔案事件可再排程
+            with self._lock:
+                self._drain_scheduled = False
+                self._pending_paths.clear()
 
     def on_modified(self, event):
         if event.is_directory:
@@ -207,35 +616,53 @@ class AutoTagHandler(FileSystemEventHandler):
         filename = os.path.basename(event.src_path)
         if is_skip_file(filename):
             return
-        self.app.schedule_refresh(300)
+        self._request_refresh()
 
     def on_moved(self, event):
         if event.is_directory:
             return
-        self.app.schedule_refresh(300)
+        self._request_refresh()
 
     def on_deleted(self, event):
         if event.is_directory:
             return
-        self.app.schedule_refresh(300)
+        self._request_refresh()
+
+    def _drain(self):
+        """一次處理累積的新檔案：每個目錄只掃描一次，已消失的檔案直接略過"""
+        with self._lock:
+            paths, self._pending_paths = self._pending_paths, set()
+            self._drain_scheduled = False
 
-    def handle_file(self, filepath: str):
         try:
-            if not os.path.exists(filepath):
-                self.processing.discard(filepath)
-                return
-            
-            # 通知用戶有新檔案
-            self.app.show_notification("📥 偵測到新檔案，請標記")
-            self.app.schedule_refresh(200)
-            
+            names_by_dir = {}
+            for path in paths:
+                folder, name = os.path.split(path)
+                names_by_dir.setdefault(folder, set()).add(name)
+
+            found = False
+            for folder, names in names_by_dir.items():
+                try:
+                    with os.scandir(folder) as it:
+                        if any(e.name in names for e in it):
+                            found = True
+                            break
+                except OSError:
+                    continue
+
+            if found:
+                # 通知用戶有新檔案
+                self.app.show_notification("📥 偵測到新檔案，請標記")
+                self._request_refresh(200)
+
         except Exception as e:
             self.app.logger.error(f"處理檔案錯誤：{e}")
-        finally:
-            self.processing.discard(filepath)
 
 # ==================== GUI ====================
 
+# 已標記檔案分組：(標籤前綴, 分組 key)，前綴沿用 AppConfig.tags 的順序
+_TAG_GROUPS = tuple(zip(AppConfig.tags, ("std", "tpl", "rev")))
+
 class NotebookLMSingleFolderApp(ctk.CTk):
     def __init__(self):
         super().__init__()
@@ -270,41 +697,141 @@ class NotebookLMSingleFolderApp(ctk.CTk):
             "small": ctk.CTkFont(family="Microsoft JhengHei UI", size=12)
         }
 
+        # 標記按鈕樣式（每列共用）
+        tag_colors = {
+            "【標準】": ("#e6f0ff", "#d6e7ff", "#007aff"),
+            "【範本】": ("#eaf7ef", "#dff2e7", "#34c759"),
+            "【待審】": ("#fdecea", "#fbd9d6", "#ff3b30")
+        }
+        self._tag_button_style = {
+            tag: {
+                "fg_color": fg,
+                "hover_color": hover,
+                "text_color": text,
+                "font": self.fonts["small"],
+                "corner_radius": 12,
+                "width": 68,
+                "height": 30
+            }
+            for tag, (fg, hover, text) in tag_colors.items()
+        }
+        # 檔案列樣板（所有列版面相同，建立時直接套用）
+        self._row_style = {
+            "frame": {
+                "fg_color": self.colors["panel"],
+                "corner_radius": 12,
+                "border_width": 1,
+                "border_color": self.colors["border"],
+                "height": 52
+            },
+            "label": {
+                "font": self.fonts["body"],
+                "text_color": self.colors["text"],
+                "anchor": "w"
+            }
+        }
+
         self.observer = None
+        # 監控處理器只建立一次，切換資料夾時重新 schedule 即可
+        self._watch_handler = AutoTagHandler(self)
+        self._watch = None
+        self._watch_key = None
+
+        # 目錄清單快取：(專案, 交付) -> (已標記, 未標記)；檔案事件或標記後標為 dirty
+        self._listing_cache: Dict[Tuple[str, str], Tuple[List[str], List[str]]] = {}
+        self._listing_dirty: Set[Tuple[str, str]] = set()
         self._refresh_job = None
+        self._min_refresh_ms = 200
+        self._last_refresh_done = 0.0
         self._clipboard_job = None
         self._last_clipboard = None
-        self._clipboard_poll_ms = 700
+        self._last_clip_key = None
+        # Windows 用剪貼簿通知；其他平台退回輪詢：
+        # 有變動後從 50ms 開始，每次未變動加倍，最長 _clipboard_poll_ms
+        self._clipboard_poll_ms = 2000
+        self._poll_delay = 50
+        self._poll_streak_idle = 0
+        self._clip_read_inflight = False
+        self._clip_listener = ClipboardListener(
+            lambda: self._post_to_ui(self._on_clipboard_change), self.logger
+        )
+
+        # 檔案 I/O 交給背景執行緒，避免卡住介面
+        self._io_pool = ThreadPoolExecutor(max_workers=2)
+        # Word 輸出依序執行：檔名只精確到秒，同時寫同一路徑會產生損毀的 .docx
+        self._export_pool = ThreadPoolExecutor(max_workers=1)
+        # 背景執行緒不呼叫 Tk：結果放入佇列，由主執行緒的 after 迴圈取出執行
+        self._ui_queue = queue.Queue()
+        self._ui_job = None
+        self._closing = False
+        self._tagging = set()
+        self._exports_in_flight: Set[Tuple[str, str]] = set()
+
+        # 未標記檔案列：顯示中的列以檔名為 key，移除的列回收到 _row_pool 重用
+        self._untagged_rows: Dict[str, dict] = {}
+        self._row_pool: List[dict] = []
+        self._untagged_empty_label = None
+        self._status_cache: Dict[Tuple[str, str], str] = {}
+
+        # 視窗最小化時延後刷新，還原後一次補上
+        self._visible = True
+        self._refresh_pending = False
+        self._notif_job = None
+        self._text_cache: Dict[object, str] = {}
 
         self._build_ui()
+        self.bind("<Map>", self._on_map, add="+")
+        self.bind("<Unmap>", self._on_unmap, add="+")
         self.refresh_all()
+        self._ui_job = self.after(50, self._drain_ui_queue)
         self._start_watchdog()
 
     def _setup_logger(self):
         logger = logging.getLogger("NotebookLM")
         logger.setLevel(logging.INFO)
-        if not logger.handlers:
-            self._log_formatter = logging.Formatter("%(asctime)s - %(message)s")
-            h = logging.StreamHandler()
-            h.setFormatter(self._log_formatter)
-            logger.addHandler(h)
-        self._add_file_handler(logger)
+        self._log_formatter = logging.Formatter("%(asctime)s - %(message)s")
+        self._log_queue = queue.Queue(-1)
+        self._log_listener = None
+        self._log_to_file = False
+
+        # logger 只掛 QueueHandler，實際輸出由背景 QueueListener 處理
+        for h in list(logger.handlers):
+            if isinstance(h, QueueHandler):
+                logger.removeHandler(h)
+        logger.addHandler(QueueHandler(self._log_queue))
+        self._start_log_listener(logger)
         return logger
 
-    def _add_file_handler(self, logger: logging.Logger):
-        if any(isinstance(h, logging.FileHandler) for h in logger.handlers):
-            return
-        formatter = getattr(self, "_log_formatter", logging.Formatter("%(asctime)s - %(message)s"))
+    def _start_log_listener(self, logger: logging.Logger):
+        """（重新）啟動背景日誌執行緒：主控台 + 日誌檔"""
+        self._stop_log_listener()
+
+        console = logging.StreamHandler()
+        console.setFormatter(self._log_formatter)
+        handlers = [console]
         try:
             log_dir = os.path.join(self.cfg.base_path, "logs")
             os.makedirs(log_dir, exist_ok=True)
             log_file = os.path.join(log_dir, f"notebooklm_{time.strftime('%Y%m%d')}.log")
             fh = logging.FileHandler(log_file, encoding="utf-8")
-            fh.setFormatter(formatter)
-            logger.addHandler(fh)
+            fh.setFormatter(self._log_formatter)
+            handlers.append(fh)
+            self._log_to_file = True
         except Exception:
+            self._log_to_file = False
+
+        self._log_listener = QueueListener(self._log_queue, *handlers)
+        self._log_listener.start()
+        if not self._log_to_file:
             logger.warning("無法建立日誌檔案，將只輸出到主控台")
 
+    def _stop_log_listener(self):
+        if self._log_listener:
+            self._log_listener.stop()
+            for h in self._log_listener.handlers:
+                h.close()
+            self._log_listener = None
+
     def _ensure_structure(self):
         try:
             self.fm.ensure_structure()
@@ -314,7 +841,8 @@ class NotebookLMSingleFolderApp(ctk.CTk):
             self.cfg.base_path = fallback
             self.fm = FileManager(self.cfg, self.logger)
             self.fm.ensure_structure()
-            self._add_file_handler(self.logger)
+            if not self._log_to_file:
+                self._start_log_listener(self.logger)
             messagebox.showwarning("資料夾權限", f"原始路徑無法寫入，已改用：\n{fallback}")
 
     def _build_ui(self):
@@ -492,7 +1020,7 @@ class NotebookLMSingleFolderApp(ctk.CTk):
         refresh_btn = ctk.CTkButton(
             header,
             text="重新整理",
-            command=self.refresh_all,
+            command=self.manual_refresh,
             height=28,
             width=72,
             font=self.fonts["small"],
@@ -604,6 +1132,7 @@ class NotebookLMSingleFolderApp(ctk.CTk):
         self.combo_review = ctk.CTkOptionMenu(
             review_row,
             values=["(無)"],
+            state="disabled",
             height=34,
             font=self.fonts["body"],
             variable=self.combo_review_var,
@@ -636,6 +1165,7 @@ class NotebookLMSingleFolderApp(ctk.CTk):
             border_color=self.colors["border"]
         )
         self.prompt_display.pack(fill="both", expand=True, padx=18, pady=(0, 12))
+        self._watch_text_edits(self.prompt_display)
 
         btn_frame = ctk.CTkFrame(prompt_card, fg_color="transparent")
         btn_frame.pack(fill="x", padx=18, pady=(0, 16))
@@ -726,6 +1256,7 @@ class NotebookLMSingleFolderApp(ctk.CTk):
             border_color=self.colors["border"]
         )
         self.reply_display.pack(fill="both", expand=True, padx=18, pady=(0, 12))
+        self._watch_text_edits(self.reply_display)
 
         reply_footer = ctk.CTkFrame(reply_card, fg_color="transparent")
         reply_footer.pack(fill="x", padx=18, pady=(0, 16))
@@ -801,9 +1332,13 @@ class NotebookLMSingleFolderApp(ctk.CTk):
             wrap="word",
             fg_color=self.colors["panel"],
             text_color=self.colors["text"],
-            border_width=0
+            border_width=0,
+            state="disabled"
         )
         self.tagged_list.pack(fill="both", expand=True, padx=12, pady=12)
+        # CTkTextbox forbids per-tag font to keep scaling consistent; use color only.
+        self.tagged_list.tag_config("header", foreground=self.colors["accent"])
+        self._tagged_sig = None
 
     def _show_file_tab(self, tab_name: str):
         if tab_name == "已標記":
@@ -846,54 +1381,43 @@ class NotebookLMSingleFolderApp(ctk.CTk):
 
         return card, header
 
-    def _create_file_item(self, parent, filename: str):
-        """創建檔案項目（含三個標記按鈕）"""
-        item = ctk.CTkFrame(
-            parent,
-            fg_color=self.colors["panel"],
-            corner_radius=12,
-            border_width=1,
-            border_color=self.colors["border"],
-            height=52
-        )
-        item.pack(fill="x", pady=5, padx=(0, 16))
+    def _create_file_row(self, parent) -> dict:
+        """創建檔案列（含三個標記按鈕），尚未 pack，檔名與指令由 _bind_file_row 綁定"""
+        style = self._row_style
+        item = ctk.CTkFrame(parent, **style["frame"])
         item.pack_propagate(False)
 
         # 檔名
-        name_label = ctk.CTkLabel(
-            item,
-            text=filename,
-            font=self.fonts["body"],
-            text_color=self.colors["text"],
-            anchor="w"
-        )
+        name_label = ctk.CTkLabel(item, text="", **style["label"])
         name_label.pack(side="left", padx=15, fill="x", expand=True)
 
         # 按鈕區
         btn_container = ctk.CTkFrame(item, fg_color="transparent")
         btn_container.pack(side="right", padx=10)
 
-        colors = {
-            "【標準】": ("#e6f0ff", "#d6e7ff", "#007aff"),
-            "【範本】": ("#eaf7ef", "#dff2e7", "#34c759"),
-            "【待審】": ("#fdecea", "#fbd9d6", "#ff3b30")
-        }
-
+        styles = self._tag_button_style
+        buttons = []
         for tag in self.cfg.tags:
-            fg, hover, text = colors[tag]
-            btn = ctk.CTkButton(
-                btn_container,
-                text=tag,
-                command=lambda t=tag, f=filename: self.tag_file(f, t),
-                width=68,
-                height=30,
-                font=self.fonts["small"],
-                fg_color=fg,
-                hover_color=hover,
-                text_color=text,
-                corner_radius=12
-            )
+            btn = ctk.CTkButton(btn_container, text=tag, **styles[tag])
             btn.pack(side="left", padx=3)
+            buttons.append(btn)
+
+        return {"frame": item, "label": name_label, "buttons": buttons}
+
+    def _acquire_row(self) -> dict:
+        if self._row_pool:
+            return self._row_pool.pop()
+        return self._create_file_row(self.untagged_container)
+
+    def _release_row(self, row: dict):
+        row["frame"].pack_forget()
+        self._row_pool.append(row)
+
+    def _bind_file_row(self, row: dict, filename: str):
+        """綁定檔案列：只更新檔名與按鈕指令"""
+        row["label"].configure(text=filename)
+        for tag, btn in zip(self.cfg.tags, row["buttons"]):
+            btn.configure(command=lambda t=tag, f=filename: self.tag_file(f, t))
 
     # ==================== 行為方法 ====================
 
@@ -904,9 +1428,31 @@ class NotebookLMSingleFolderApp(ctk.CTk):
         return self.combo_delivery.get()
 
     def on_selection_change(self):
+        # 切換前未監控該資料夾，快取可能已過期
+        self.invalidate_listing((self.current_project(), self.current_delivery()))
         self.refresh_all()
         self._restart_watchdog()
 
+    def manual_refresh(self):
+        self.invalidate_listing((self.current_project(), self.current_delivery()))
+        self._tagged_sig = None
+        self.refresh_all()
+
+    def invalidate_listing(self, key: Optional[Tuple[str, str]] = None):
+        """標記目錄清單需重新掃描；key 省略時為目前監控中的資料夾（可由監控執行緒呼叫）"""
+        key = key or self._watch_key
+        if key:
+            self._listing_dirty.add(key)
+
+    def _get_listing(self, project: str, delivery: str) -> Tuple[List[str], List[str]]:
+        key = (project, delivery)
+        cached = self._listing_cache.get(key)
+        if cached is None or key in self._listing_dirty:
+            # 先清除 dirty 再掃描，掃描期間的新事件會留到下次刷新
+            self._listing_dirty.discard(key)
+            cached = self._listing_cache[key] = self.fm.list_input_files(project, delivery)
+        return cached
+
     def open_input(self):
         path = self.fm.input_dir(self.current_project(), self.current_delivery())
         open_folder(path)
@@ -925,150 +1471,236 @@ class NotebookLMSingleFolderApp(ctk.CTk):
         )
         messagebox.showinfo("使用說明", help_text)
 
+    def _post_to_ui(self, callback, *args):
+        """背景工作完成後交回主執行緒（只放入佇列，可在任何執行緒呼叫）"""
+        if not self._closing:
+            self._ui_queue.put((callback, args))
+
+    def _drain_ui_queue(self):
+        self._ui_job = None
+        while True:
+            try:
+                callback, args = self._ui_queue.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                callback(*args)
+            except Exception as e:
+                self.logger.error("背景工作回呼失敗：%s", e)
+        if not self._closing:
+            self._ui_job = self.after(50, self._drain_ui_queue)
+
     def tag_file(self, filename: str, tag: str):
-        """標記檔案"""
-        p, d = self.current_project(), self.current_delivery()
-        success, result = self.fm.tag_file(p, d, filename, tag)
-        
+        """標記檔案（背景執行，完成後回到主執行緒更新介面）"""
+        if filename in self._tagging:
+            return
+        self._tagging.add(filename)
+        key = (self.current_project(), self.current_delivery())
+        fut = self._io_pool.submit(self.fm.tag_file, *key, filename, tag)
+        fut.add_done_callback(lambda f: self._post_to_ui(self._on_tag_done, f, key, filename, tag))
+
+    def _on_tag_done(self, fut, key: Tuple[str, str], filename: str, tag: str):
+        self._tagging.discard(filename)
+        try:
+            success, result = fut.result()
+        except Exception as e:
+            success, result = False, str(e)
+
         if success:
             self.show_notification(f"✓ 已標記為 {tag}")
-            self.refresh_all()
+            self.invalidate_listing(key)
+            self.schedule_refresh(0)
         else:
             messagebox.showerror("錯誤", f"標記失敗：{result}")
 
     def refresh_all(self):
         """刷新所有顯示"""
         p, d = self.current_project(), self.current_delivery()
-        tagged, untagged = self.fm.list_input_files(p, d)
+        tagged, untagged = self._get_listing(p, d)
+        groups = self._categorize(tagged)
         self.refresh_untagged_files(untagged)
-        self.refresh_tagged_files(tagged)
-        self.refresh_review_combo(tagged)
+        self.refresh_tagged_files(groups)
+        self.refresh_review_combo(groups)
         self._update_status(tagged, untagged)
+        self._last_refresh_done = time.monotonic()
 
     def refresh_untagged_files(self, untagged: Optional[List[str]] = None):
-        """刷新未標記檔案列表"""
-        # 清空容器
-        for widget in self.untagged_container.winfo_children():
-            widget.destroy()
-
+        """刷新未標記檔案列表（依檔名差異更新：只處理新增與移除的檔案）"""
         if untagged is None:
             p, d = self.current_project(), self.current_delivery()
-            _, untagged = self.fm.list_input_files(p, d)
+            _, untagged = self._get_listing(p, d)
+
+        rows = self._untagged_rows
+        keep = set(untagged)
+        for filename in [f for f in rows if f not in keep]:
+            self._release_row(rows.pop(filename))
 
         if not untagged:
-            empty_label = ctk.CTkLabel(
-                self.untagged_container,
-                text="沒有未標記的檔案\n\n把檔案放入 input 資料夾\n即可在這裡快速標記",
-                font=self.fonts["small"],
-                text_color=self.colors["muted"],
-                justify="center"
-            )
-            empty_label.pack(pady=50)
+            if self._untagged_empty_label is None:
+                self._untagged_empty_label = ctk.CTkLabel(
+                    self.untagged_container,
+                    text="沒有未標記的檔案\n\n把檔案放入 input 資料夾\n即可在這裡快速標記",
+                    font=self.fonts["small"],
+                    text_color=self.colors["muted"],
+                    justify="center"
+                )
+            self._untagged_empty_label.pack(pady=50)
         else:
-            for filename in untagged:
-                self._create_file_item(self.untagged_container, filename)
+            if self._untagged_empty_label is not None:
+                self._untagged_empty_label.pack_forget()
 
-    def refresh_tagged_files(self, tagged: Optional[List[str]] = None):
-        """刷新已標記檔案列表"""
-        self.tagged_list.delete("1.0", "end")
-
-        if tagged is None:
-            p, d = self.current_project(), self.current_delivery()
-            tagged, _ = self.fm.list_input_files(p, d)
+            # 留下的列已依檔名排序，新列插在前一列之後即可維持順序
+            first_kept = next((rows[f]["frame"] for f in untagged if f in rows), None)
+            pack_opts = {"fill": "x", "pady": 5, "padx": (0, 16)}
+            prev = None
+            for filename in untagged:
+                row = rows.get(filename)
+                if row is None:
+                    row = rows[filename] = self._acquire_row()
+                    self._bind_file_row(row, filename)
+                    if prev is not None:
+                        row["frame"].pack(after=prev, **pack_opts)
+                    elif first_kept is not None:
+                        row["frame"].pack(before=first_kept, **pack_opts)
+                    else:
+                        row["frame"].pack(**pack_opts)
+                prev = row["frame"]
+
+    def _categorize(self, tagged: List[str]) -> Dict[str, List[str]]:
+        """已標記檔案依標籤分組（單次掃描）：{"std", "tpl", "rev"}"""
+        out = {key: [] for _, key in _TAG_GROUPS}
+        for f in tagged:
+            for pfx, key in _TAG_GROUPS:
+                if f.startswith(pfx):
+                    out[key].append(f)
+                    break
+        return out
+
+    def _current_groups(self) -> Dict[str, List[str]]:
+        tagged, _ = self._get_listing(self.current_project(), self.current_delivery())
+        return self._categorize(tagged)
+
+    def refresh_tagged_files(self, groups: Optional[Dict[str, List[str]]] = None):
+        """刷新已標記檔案列表（內容未變時不重建）"""
+        if groups is None:
+            groups = self._current_groups()
+        std, tpl, rev = groups["std"], groups["tpl"], groups["rev"]
+
+        sig = (tuple(std), tuple(tpl), tuple(rev))
+        if sig == self._tagged_sig:
+            return
+        self._tagged_sig = sig
 
-        if not tagged:
-            self.tagged_list.insert("end", "\n  尚無已標記檔案")
+        lines = []
+        headers = []
+        if not (std or tpl or rev):
+            lines = ["", "  尚無已標記檔案"]
         else:
-            std = [f for f in tagged if f.startswith("【標準】")]
-            tpl = [f for f in tagged if f.startswith("【範本】")]
-            rev = [f for f in tagged if f.startswith("【待審】")]
-
-            if std:
-                self.tagged_list.insert("end", "標準文件\n", "header")
-                for f in std:
-                    self.tagged_list.insert("end", f"  • {f}\n")
-                self.tagged_list.insert("end", "\n")
-
-            if tpl:
-                self.tagged_list.insert("end", "範本文件\n", "header")
-                for f in tpl:
-                    self.tagged_list.insert("end", f"  • {f}\n")
-                self.tagged_list.insert("end", "\n")
-
-            if rev:
-                self.tagged_list.insert("end", "待審文件\n", "header")
-                for f in rev:
-                    self.tagged_list.insert("end", f"  • {f}\n")
-
-        # CTkTextbox forbids per-tag font to keep scaling consistent; use color only.
-        self.tagged_list.tag_config("header", foreground=self.colors["accent"])
-
-    def refresh_review_combo(self, tagged: Optional[List[str]] = None):
+            sections = [("標準文件", std), ("範本文件", tpl), ("待審文件", rev)]
+            for title, files in sections:
+                if not files:
+                    continue
+                if lines:
+                    lines.append("")
+                headers.append(len(lines) + 1)
+                lines.append(title)
+                lines.extend(f"  • {f}" for f in files)
+            lines.append("")
+
+        # 一次插入全部內容，再套用標題顏色
+        # 清單唯讀，只在更新時暫時開啟編輯
+        box = self.tagged_list
+        box.configure(state="normal")
+        box.delete("1.0", "end")
+        box.insert("1.0", "\n".join(lines))
+        for line_no in headers:
+            box.tag_add("header", f"{line_no}.0", f"{line_no}.end")
+        box.configure(state="disabled")
+
+    def refresh_review_combo(self, groups: Optional[Dict[str, List[str]]] = None):
         """刷新待審檔案下拉選單"""
-        if tagged is None:
-            p, d = self.current_project(), self.current_delivery()
-            tagged, _ = self.fm.list_input_files(p, d)
-
-        review = [f for f in tagged if f.startswith("【待審】")]
-        if review:
-            self.combo_review.configure(values=review, state="normal")
-            self.combo_review.set(review[0])
-        else:
-            self.combo_review.configure(values=["(無)"], state="disabled")
-            self.combo_review.set("(無)")
+        if groups is None:
+            groups = self._current_groups()
+
+        review = groups["rev"]
+        values = review or ["(無)"]
+        state = "normal" if review else "disabled"
+        if (list(self.combo_review.cget("values")) != values
+                or self.combo_review.cget("state") != state):
+            self.combo_review.configure(values=values, state=state)
+
+        # 保留使用者目前的選擇，除非該檔案已不在清單中
+        cur = self.combo_review.get()
+        if cur not in values:
+            self.combo_review.set(values[0])
+
+    @staticmethod
+    def _set_label_text(widget, text: str, **kwargs):
+        """文字相同時不呼叫 configure（CTk 每次 configure 都會重算寬度並重繪）"""
+        if widget.cget("text") != text:
+            widget.configure(text=text, **kwargs)
 
     def _update_status(self, tagged: List[str], untagged: List[str]):
         if hasattr(self, "untagged_header_label"):
-            self.untagged_header_label.configure(text=f"待標記檔案 ({len(untagged)})")
+            self._set_label_text(self.untagged_header_label, f"待標記檔案 ({len(untagged)})")
         if hasattr(self, "tagged_header_label"):
-            self.tagged_header_label.configure(text=f"已標記檔案 ({len(tagged)})")
+            self._set_label_text(self.tagged_header_label, f"已標記檔案 ({len(tagged)})")
 
         p, d = self.current_project(), self.current_delivery()
         if hasattr(self, "status_left"):
-            self.status_left.configure(
-                text=f"專案：{p}  交付：{d}  |  待標記：{len(untagged)}  已標記：{len(tagged)}"
+            self._set_label_text(
+                self.status_left,
+                f"專案：{p}  交付：{d}  |  待標記：{len(untagged)}  已標記：{len(tagged)}"
             )
         if hasattr(self, "status_right"):
-            input_path = shorten_path(self.fm.input_dir(p, d), 52)
-            output_path = shorten_path(self.fm.output_dir(p, d), 52)
-            self.status_right.configure(text=f"input: {input_path}  |  output: {output_path}")
+            # 路徑只隨專案/交付改變，格式化結果依 (專案, 交付) 快取
+            text = self._status_cache.get((p, d))
+            if text is None:
+                input_path = shorten_path(self.fm.input_dir(p, d), 52)
+                output_path = shorten_path(self.fm.output_dir(p, d), 52)
+                text = self._status_cache[(p, d)] = f"input: {input_path}  |  output: {output_path}"
+            self._set_label_text(self.status_right, text)
 
     def generate_prompt(self):
         """生成審查提示詞"""
-        p, d = self.current_project(), self.current_delivery()
-        tagged, untagged = self.fm.list_input_files(p, d)
-        self.refresh_review_combo(tagged)
-        
-        std = [f for f in tagged if f.startswith("【標準】")]
-        tpl = [f for f in tagged if f.startswith("【範本】")]
+        if isinstance(self.observer, PollingObserver):
+            # 輪詢監控最多延遲 watch_interval 秒，使用者主動操作時重新掃描
+            self.invalidate_listing((self.current_project(), self.current_delivery()))
+        groups = self._current_groups()
+        self.refresh_review_combo(groups)
+
+        std, tpl = groups["std"], groups["tpl"]
         tgt = self.combo_review_var.get()
 
         if tgt == "(無)":
             messagebox.showwarning("提醒", "沒有待審檔案")
             return
 
-        prompt = f"""請以【標準】與【範本】作為依據，逐條審查【待審】文件：{tgt}
-
-【標準】
-""" + "\n".join(f"- {x}" for x in std or ["(無)"]) + """
-
-【範本】
-""" + "\n".join(f"- {x}" for x in tpl or ["(無)"]) + """
-
-請輸出：
-1) 不符合之處
-2) 風險
-3) 具體修改建議
-4) 需人工確認事項
-"""
+        parts = [
+            f"請以【標準】與【範本】作為依據，逐條審查【待審】文件：{tgt}",
+            "",
+            "【標準】",
+            *(f"- {x}" for x in std or ["(無)"]),
+            "",
+            "【範本】",
+            *(f"- {x}" for x in tpl or ["(無)"]),
+            "",
+            "請輸出：",
+            "1) 不符合之處",
+            "2) 風險",
+            "3) 具體修改建議",
+            "4) 需人工確認事項",
+            "",
+        ]
+        prompt = "\n".join(parts)
 
-        self.prompt_display.delete("1.0", "end")
-        self.prompt_display.insert("1.0", prompt)
+        if self._get_text(self.prompt_display) != prompt:
+            self._replace_text(self.prompt_display, prompt)
         self.show_notification("✓ 提示詞已生成")
 
     def copy_prompt(self):
         """複製提示詞"""
-        txt = self.prompt_display.get("1.0", "end").strip()
+        txt = self._get_text(self.prompt_display).strip()
         if not txt:
             messagebox.showwarning("提醒", "提示詞是空的")
             return
@@ -1077,11 +1709,11 @@ class NotebookLMSingleFolderApp(ctk.CTk):
         self.show_notification("✓ 已複製到剪貼簿")
 
     def clear_prompt(self):
-        self.prompt_display.delete("1.0", "end")
+        self._replace_text(self.prompt_display, "")
         self.show_notification("✓ 提示詞已清空")
 
     def clear_reply(self):
-        self.reply_display.delete("1.0", "end")
+        self._replace_text(self.reply_display, "")
         self.show_notification("✓ 回覆內容已清空")
 
     def _get_clipboard_text(self) -> str:
@@ -1093,13 +1725,34 @@ class NotebookLMSingleFolderApp(ctk.CTk):
             return ""
         return text.strip()
 
+    def _watch_text_edits(self, box):
+        """文字框內容快取：使用者編輯（<<Modified>>）時才失效"""
+        box.bind("<<Modified>>", lambda _e, b=box: self._on_text_modified(b), add="+")
+
+    def _on_text_modified(self, box):
+        # 程式寫入後會先清除 modified 旗標，延遲送達的事件在此略過
+        if box.edit_modified():
+            self._text_cache.pop(box, None)
+            box.edit_modified(False)
+
+    def _get_text(self, box) -> str:
+        text = self._text_cache.get(box)
+        if text is None:
+            text = self._text_cache[box] = box.get("1.0", "end-1c")
+        return text
+
+    def _replace_text(self, box, text: str):
+        box.delete("1.0", "end")
+        box.insert("1.0", text)
+        box.edit_modified(False)
+        self._text_cache[box] = text
+
     def _set_reply_text(self, text: str):
-        self.reply_display.delete("1.0", "end")
-        self.reply_display.insert("1.0", text)
+        self._replace_text(self.reply_display, text)
 
     def export_word(self):
         """輸出 Word 報告"""
-        content = self.reply_display.get("1.0", "end").strip()
+        content = self._get_text(self.reply_display).strip()
         self._export_content(content, open_dir=True, show_error_dialog=True)
 
     def export_word_from_clipboard(self):
@@ -1128,90 +1781,216 @@ class NotebookLMSingleFolderApp(ctk.CTk):
                 self.show_notification("⚠ 請先選擇待審檔案")
             return False
 
+        # 同一份內容輸出中時不重複送出（例如連點按鈕）
+        key = (tgt, content)
+        if key in self._exports_in_flight:
+            return False
+        self._exports_in_flight.add(key)
+
+        out_dir = self.fm.output_dir(self.current_project(), self.current_delivery())
+        fut = self._export_pool.submit(self.exporter.export, out_dir, tgt, content)
+        fut.add_done_callback(
+            lambda f: self._post_to_ui(self._on_export_done, f, key, open_dir, show_error_dialog)
+        )
+        return True
+
+    def _on_export_done(self, fut, key: Tuple[str, str], open_dir: bool, show_error_dialog: bool):
+        self._exports_in_flight.discard(key)
         try:
-            path = self.exporter.export(
-                self.fm.output_dir(self.current_project(), self.current_delivery()),
-                tgt,
-                content
-            )
+            path = fut.result()
             self.show_notification(f"✓ Word 已輸出：{os.path.basename(path)}")
             if open_dir:
                 open_folder(os.path.dirname(path))
-            return True
         except Exception as e:
             self.logger.error("Word 輸出失敗：%s", e)
             if show_error_dialog:
                 messagebox.showerror("錯誤", f"Word 輸出失敗：{e}")
             else:
                 self.show_notification("⚠ Word 輸出失敗")
-            return False
 
     def show_notification(self, message: str):
-        """顯示通知"""
-        self.notification.configure(text=f"  {message}  ", height=36)
-        self.after(3000, lambda: self.notification.configure(text="", height=0))
+        """顯示通知（只保留一個清除計時器，新通知會重新計時）"""
+        if self._notif_job:
+            self.after_cancel(self._notif_job)
+        self._set_label_text(self.notification, f"  {message}  ", height=36)
+        self._notif_job = self.after(3000, self._clear_notification)
+
+    def _clear_notification(self):
+        self._notif_job = None
+        self._set_label_text(self.notification, "", height=0)
 
     def toggle_clipboard_watch(self):
         if self.clipboard_auto_var.get():
             self._last_clipboard = None
+            self._last_clip_key = None
+            self._poll_delay = 50
+            self._poll_streak_idle = 0
             self.show_notification("✓ 已啟用剪貼簿監聽")
-            self._schedule_clipboard_poll(immediate=True)
+            if self._clip_listener.start():
+                self.after(10, self._on_clipboard_change)
+            else:
+                self._schedule_clipboard_poll(immediate=True)
         else:
             if self._clipboard_job:
                 self.after_cancel(self._clipboard_job)
                 self._clipboard_job = None
+            self._clip_listener.stop()
             self.show_notification("✓ 已停止剪貼簿監聽")
 
     def _schedule_clipboard_poll(self, immediate: bool = False):
         if self._clipboard_job:
             self.after_cancel(self._clipboard_job)
-        delay = 10 if immediate else self._clipboard_poll_ms
+        delay = 10 if immediate else self._poll_delay
+        if not self._visible:
+            delay = max(delay, 1000)
         self._clipboard_job = self.after(delay, self._poll_clipboard)
 
     def _poll_clipboard(self):
         self._clipboard_job = None
         if not self.clipboard_auto_var.get():
             return
-        content = self._get_clipboard_text()
+        if _CLIP_READ_CMD:
+            # 背景讀取；上一次還沒回來就不再送出，結果回來後再排下一次
+            if self._clip_read_inflight:
+                return
+            self._clip_read_inflight = True
+            fut = self._io_pool.submit(read_clipboard_external)
+            fut.add_done_callback(lambda f: self._post_to_ui(self._handle_clip_result, f))
+            return
+        self._update_poll_delay(self._on_clipboard_change())
+        self._schedule_clipboard_poll()
+
+    def _handle_clip_result(self, fut):
+        self._clip_read_inflight = False
+        if not self.clipboard_auto_var.get():
+            return
+        try:
+            raw = fut.result()
+        except Exception:
+            raw = None
+        if raw is None:
+            changed = self._on_clipboard_change()
+        else:
+            changed = self._handle_clip_text(raw)
+        self._update_poll_delay(changed)
+        self._schedule_clipboard_poll()
+
+    def _update_poll_delay(self, changed: bool):
+        if changed:
+            self._poll_streak_idle = 0
+        else:
+            self._poll_streak_idle += 1
+        self._poll_delay = min(self._clipboard_poll_ms, 50 * 2 ** min(self._poll_streak_idle, 6))
+
+    def _on_clipboard_change(self) -> bool:
+        """讀取剪貼簿並處理；回傳內容是否有變動"""
+        if not self.clipboard_auto_var.get():
+            return False
+        try:
+            raw = self.clipboard_get()
+        except TclError:
+            return False
+        if not isinstance(raw, str):
+            return False
+        return self._handle_clip_text(raw)
+
+    def _handle_clip_text(self, raw: str) -> bool:
+        # 先比對長度與雜湊，未變動時不做 strip 與全文比較
+        key = (len(raw), hash(raw))
+        if key == self._last_clip_key:
+            return False
+        self._last_clip_key = key
+
+        content = raw.strip()
         if content and content != self._last_clipboard:
             self._last_clipboard = content
             self._set_reply_text(content)
             self._export_content(content, open_dir=False, show_error_dialog=False)
-        self._schedule_clipboard_poll()
+        return True
 
-    def schedule_refresh(self, delay_ms: int = 300):
+    def schedule_refresh(self, delay_ms: int = 250):
+        """排程刷新（防抖：連續呼叫只保留最後一次）"""
+        delay_ms = max(delay_ms, self._min_refresh_ms)
         if self._refresh_job:
             self.after_cancel(self._refresh_job)
         self._refresh_job = self.after(delay_ms, self._run_refresh)
 
     def _run_refresh(self):
         self._refresh_job = None
+        handler = self._watch_handler
+        if handler is not None:
+            # 檔案事件仍在持續（例如大量複製），等安靜下來再刷新
+            quiet_ms = int((time.monotonic() - handler.last_event) * 1000)
+            if quiet_ms < self._min_refresh_ms:
+                self.schedule_refresh(self._min_refresh_ms - quiet_ms)
+                return
+            handler.refresh_done()
+
+        if not self._visible:
+            self._refresh_pending = True
+            return
+
+        # 剛刷新完且清單沒有變動時不必重做
+        key = (self.current_project(), self.current_delivery())
+        if time.monotonic() - self._last_refresh_done < 0.05 and key not in self._listing_dirty:
+            return
         self.refresh_all()
 
+    def _on_map(self, event):
+        # 子元件的 Map 事件也會傳到主視窗的綁定，只處理主視窗本身
+        if event.widget is not self:
+            return
+        self._visible = True
+        if self._refresh_pending:
+            self._refresh_pending = False
+            self.schedule_refresh(0)
+
+    def _on_unmap(self, event):
+        if event.widget is self:
+            self._visible = False
+
     def _start_watchdog(self):
         """啟動檔案監控"""
         if self.observer is None:
-            self.observer = Observer()
+            if is_remote_path(self.cfg.base_path):
+                self.logger.info("偵測到網路磁碟，改用輪詢監控（每 %s 秒）", self.cfg.watch_interval)
+                self.observer = PollingObserver(timeout=self.cfg.watch_interval)
+            else:
+                self.observer = Observer()
             self.observer.start()
         self._restart_watchdog()
 
     def _restart_watchdog(self):
         """重新啟動檔案監控"""
         if self.observer:
-            self.observer.unschedule_all()
-            watch_path = self.fm.input_dir(self.current_project(), self.current_delivery())
-            handler = AutoTagHandler(self)
-            self.observer.schedule(handler, watch_path, recursive=False)
+            key = (self.current_project(), self.current_delivery())
+            if self._watch is not None and key == self._watch_key:
+                return
+            if self._watch is not None:
+                self.observer.unschedule(self._watch)
+            self._watch_key = key
+            watch_path = self.fm.input_dir(*key)
+            self._watch = self.observer.schedule(self._watch_handler, watch_path, recursive=False)
 
     def destroy(self):
         """清理資源"""
+        self._closing = True
+        if self._ui_job:
+            self.after_cancel(self._ui_job)
+            self._ui_job = None
         if self._clipboard_job:
             self.after_cancel(self._clipboard_job)
             self._clipboard_job = None
+        self._clip_listener.stop()
         if self.observer:
             self.observer.stop()
             self.observer.join()
         super().destroy()
+        # 背景工作只把結果放入佇列、不等待主執行緒，這裡等它們完成不會卡住；
+        # 完成後日誌才全部寫出，最後關閉日誌執行緒
+        self._io_pool.shutdown(wait=True)
+        self._export_pool.shutdown(wait=True)
+        self._stop_log_listener()
 
 # ==================== main ====================
 